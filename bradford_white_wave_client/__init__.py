@@ -1,15 +1,49 @@
 __version__ = "0.1.2"
 
-from .client import BradfordWhiteClient
-from .exceptions import (
-    BradfordWhiteError,
-    BradfordWhiteAuthError,
-    BradfordWhiteConnectError,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .auth import BradfordWhiteAuth
+    from .client import BradfordWhiteClient
+    from .exceptions import (
+        BradfordWhiteError,
+        BradfordWhiteAuthError,
+        BradfordWhiteConnectError,
+    )
+    from .models import BradfordWhiteMode
+
+# Public names are resolved on first access so that importing the package
+# does not pull in aiohttp or pydantic until they are actually needed.
+_LAZY_IMPORTS = {
+    "BradfordWhiteAuth": ".auth",
+    "BradfordWhiteClient": ".client",
+    "BradfordWhiteError": ".exceptions",
+    "BradfordWhiteAuthError": ".exceptions",
+    "BradfordWhiteConnectError": ".exceptions",
+    "BradfordWhiteMode": ".models",
+}
 
 __all__ = [
+    "BradfordWhiteAuth",
     "BradfordWhiteClient",
     "BradfordWhiteError",
     "BradfordWhiteAuthError",
     "BradfordWhiteConnectError",
+    "BradfordWhiteMode",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
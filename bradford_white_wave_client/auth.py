@@ -1,7 +1,8 @@
+from __future__ import annotations
+
 import logging
 import urllib.parse
-import aiohttp
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from .const import (
     AUTH_URL, 
     TOKEN_URL, 
@@ -12,6 +13,9 @@ from .const import (
 )
 from .exceptions import BradfordWhiteAuthError
 
+if TYPE_CHECKING:
+    import aiohttp
+
 _LOGGER = logging.getLogger(__name__)
 
 class BradfordWhiteAuth:
@@ -22,6 +26,9 @@ class BradfordWhiteAuth:
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
+            # Deferred so that URL helpers don't pay for importing aiohttp
+            import aiohttp
+
             # Debug Trace Config
             async def on_request_start(session, trace_config_ctx, params):
                 _LOGGER.debug(f">> Request: {params.method} {params.url}")
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, Union, List
 from enum import IntEnum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class BradfordWhiteMode(IntEnum):
     """Enum for water heater operation modes."""
@@ -13,6 +13,8 @@ class BradfordWhiteMode(IntEnum):
 
 class DeviceStatus(BaseModel):
     """Model for device status response."""
+    model_config = ConfigDict(defer_build=True)
+
     # Common fields
     mac_address: str = Field(..., alias="macAddress")
     friendly_name: str = Field(..., alias="friendlyName")
@@ -30,6 +32,8 @@ class DeviceStatus(BaseModel):
 
 class EnergyUsage(BaseModel):
     """Model for a single energy usage data point."""
+    model_config = ConfigDict(defer_build=True)
+
     timestamp: datetime
     total_energy: float = Field(..., alias="total_energy")
     heat_pump_energy: float = Field(..., alias="heat_pump_energy")
@@ -38,6 +42,8 @@ class EnergyUsage(BaseModel):
 
 class WriteResponse(BaseModel):
     """Model for write operation responses."""
+    model_config = ConfigDict(defer_build=True)
+
     status: str
     
     # Setpoint fields
@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import bradford_white_wave_client
+
+# Budgets for a cold `import bradford_white_wave_client` in a fresh interpreter.
+# Raise these deliberately if a new import is genuinely worth the cost.
+IMPORT_TIME_BUDGET = 0.15
+IMPORT_MODULE_BUDGET = 75
+HEAVY_MODULES = ("aiohttp", "pydantic")
+
+_PROBE = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import bradford_white_wave_client
+{extra}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+
+def _probe(extra: str = "") -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(extra=extra)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout)
+
+
+def _heavy(modules):
+    return [m for m in modules if m.split(".")[0] in HEAVY_MODULES]
+
+
+def test_cold_import_is_within_budget():
+    # Best of a few runs to keep the timing check stable on noisy machines
+    results = [_probe() for _ in range(3)]
+    elapsed = min(r["elapsed"] for r in results)
+    modules = results[0]["modules"]
+
+    assert _heavy(modules) == []
+    assert len(modules) <= IMPORT_MODULE_BUDGET, modules
+    assert elapsed <= IMPORT_TIME_BUDGET
+
+
+def test_auth_helpers_do_not_import_heavy_dependencies():
+    result = _probe(
+        "from bradford_white_wave_client import BradfordWhiteAuth\n"
+        "BradfordWhiteAuth().generate_auth_url('state', 'nonce')\n"
+        "BradfordWhiteAuth.parse_redirect_url('x://y?code=abc')"
+    )
+    assert _heavy(result["modules"]) == []
+
+
+def test_lazy_attributes_resolve():
+    from bradford_white_wave_client.auth import BradfordWhiteAuth
+    from bradford_white_wave_client.client import BradfordWhiteClient
+    from bradford_white_wave_client.exceptions import BradfordWhiteError
+    from bradford_white_wave_client.models import BradfordWhiteMode
+
+    assert bradford_white_wave_client.BradfordWhiteAuth is BradfordWhiteAuth
+    assert bradford_white_wave_client.BradfordWhiteClient is BradfordWhiteClient
+    assert bradford_white_wave_client.BradfordWhiteError is BradfordWhiteError
+    assert bradford_white_wave_client.BradfordWhiteMode is BradfordWhiteMode
+    assert set(bradford_white_wave_client.__all__) <= set(dir(bradford_white_wave_client))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        bradford_white_wave_client.DoesNotExist